@@ -1,4 +1,21 @@
-from config.settings import BASE_API_URL
+import requests
+
+from config.settings import AUTH_TOKEN, BASE_API_URL
+
+
+def make_session():
+    """
+    Create a requests.Session authenticated against the Employees API.
+
+    Returns:
+        requests.Session: Session with Authorization and Content-Type headers.
+    """
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": AUTH_TOKEN,
+        "Content-Type": "application/json"
+    })
+    return session
 
 
 class EmployeesAPI:
@@ -15,15 +32,21 @@ class EmployeesAPI:
     - Any required middleware (logging, retries, etc.)
     """
 
-    def __init__(self, session):
+    def __init__(self, session, base_url=BASE_API_URL, timeout=None):
         """
         Initialize the EmployeesAPI client.
 
         Args:
             session: A preconfigured requests.Session instance
                      with authentication and default headers.
+            base_url (str, optional): API base URL. Defaults to BASE_API_URL;
+                                      override to target a proxy.
+            timeout (float | tuple, optional): Timeout passed to every request.
+                                               None waits indefinitely.
         """
         self.session = session
+        self.base_url = base_url
+        self.timeout = timeout
 
     def create_employee(self, payload):
         """
@@ -41,8 +64,9 @@ class EmployeesAPI:
             - Newly created employee should be retrievable via GET /Employees.
         """
         return self.session.post(
-            f"{BASE_API_URL}/api/Employees",
-            json=payload
+            f"{self.base_url}/api/Employees",
+            json=payload,
+            timeout=self.timeout
         )
 
     def get_employees(self):
@@ -57,7 +81,8 @@ class EmployeesAPI:
             - Response body should contain a list of employee objects.
         """
         return self.session.get(
-            f"{BASE_API_URL}/api/Employees"
+            f"{self.base_url}/api/Employees",
+            timeout=self.timeout
         )
 
     def get_employee(self, employee_id):
@@ -75,7 +100,8 @@ class EmployeesAPI:
             - Status code 404 if the employee does not exist.
         """
         return self.session.get(
-            f"{BASE_API_URL}/api/Employees/{employee_id}"
+            f"{self.base_url}/api/Employees/{employee_id}",
+            timeout=self.timeout
         )
 
     def update_employee(self, payload):
@@ -94,8 +120,9 @@ class EmployeesAPI:
             - Updated data should be reflected in subsequent GET requests.
         """
         return self.session.put(
-            f"{BASE_API_URL}/api/Employees",
-            json=payload
+            f"{self.base_url}/api/Employees",
+            json=payload,
+            timeout=self.timeout
         )
 
     def delete_employee(self, employee_id):
@@ -113,5 +140,6 @@ class EmployeesAPI:
             - Employee should no longer appear in GET /Employees.
         """
         return self.session.delete(
-            f"{BASE_API_URL}/api/Employees/{employee_id}"
+            f"{self.base_url}/api/Employees/{employee_id}",
+            timeout=self.timeout
         )
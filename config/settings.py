@@ -1,7 +1,20 @@
-BASE_UI_URL = "https://wmxrwq14uc.execute-api.us-east-1.amazonaws.com/Prod/Account/Login"
-BASE_API_URL = "https://wmxrwq14uc.execute-api.us-east-1.amazonaws.com/Prod"
+import os
+
+# Origin of the Benefits Dashboard. BASE_UI_URL and BASE_API_URL can be
+# overridden through environment variables, e.g. to route traffic through
+# the local fault-injection proxy (tools/fault_proxy.py).
+UPSTREAM_URL = "https://wmxrwq14uc.execute-api.us-east-1.amazonaws.com"
+# API Gateway stage prefix shared by the UI and the API.
+STAGE_PATH = "/Prod"
+
+BASE_UI_URL = os.environ.get("BASE_UI_URL", f"{UPSTREAM_URL}{STAGE_PATH}/Account/Login")
+BASE_API_URL = os.environ.get("BASE_API_URL", f"{UPSTREAM_URL}{STAGE_PATH}")
 
 USERNAME = "TestUser846"
 PASSWORD = "@$@zHnq2@igU"
 
 AUTH_TOKEN = "Basic VGVzdFVzZXI4NDY6QCRAekhucTJAaWdV"
+
+DURATIONS_DB = "durations.db"
+TEST_MAP = ".testmap.json"
+SNAPSHOTS_DB = "snapshots.db"
@@ -1,28 +1,126 @@
+import os
 import pytest
-import requests
 from selenium import webdriver
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
-from config.settings import AUTH_TOKEN
+from api.client import make_session
+from config.settings import DURATIONS_DB, TEST_MAP
+from tools.change_selection import ChangeAwareSelector
+from tools.duration_store import DurationRecorder, DurationStore, endpoint_hook
+
+pytest_plugins = ["pytester"]
+
+
+def pytest_addoption(parser):
+    """
+    Register command line options for the duration store and test selection.
+
+    - --durations-db: SQLite file where per-test and per-endpoint
+      durations are appended on every run.
+    - --no-durations-db: Disable duration recording for this run.
+    - --longest-first: Schedule tests by historical median duration,
+      longest first. Tests without history run first.
+    - --changed-only: Run only tests affected by changed files, plus
+      tests that failed last time and tests not yet in the map.
+    - --full-run: Run every test, overriding --changed-only.
+    """
+    group = parser.getgroup("durations")
+    group.addoption("--durations-db", default=DURATIONS_DB,
+                    help="SQLite file storing historical test durations")
+    group.addoption("--no-durations-db", action="store_true",
+                    help="Do not record durations for this run")
+    group.addoption("--longest-first", action="store_true",
+                    help="Run tests with the longest historical duration first")
+
+    group = parser.getgroup("selection")
+    group.addoption("--test-map", default=TEST_MAP,
+                    help="JSON file mapping tests to the files they depend on")
+    group.addoption("--changed-only", action="store_true",
+                    help="Run only tests affected by changed files and previous failures")
+    group.addoption("--full-run", action="store_true",
+                    help="Run the full suite, ignoring --changed-only")
+
+
+def durations_db_path(config):
+    """
+    Resolve --durations-db against the rootdir, so running from a
+    subdirectory keeps using the same history.
+    """
+    return os.path.join(str(config.rootpath), config.getoption("durations_db"))
+
+
+def pytest_configure(config):
+    """
+    Register the change-aware selector, open the duration store, start a
+    new run and register the recorder.
+    """
+    select = config.getoption("changed_only") and not config.getoption("full_run")
+    config.pluginmanager.register(
+        ChangeAwareSelector(
+            str(config.rootpath),
+            os.path.join(str(config.rootpath), config.getoption("test_map")),
+            select
+        ),
+        "change_aware_selector"
+    )
+
+    config.duration_store = None
+    if config.getoption("no_durations_db") or config.option.collectonly or config.option.help:
+        return
+    config.duration_store = DurationStore(durations_db_path(config))
+    config.duration_store.start_run()
+    config.pluginmanager.register(DurationRecorder(config.duration_store), "duration_recorder")
+
+
+def pytest_unconfigure(config):
+    """
+    Flush recorded durations to disk.
+    """
+    store = getattr(config, "duration_store", None)
+    if store is not None:
+        store.close()
+        config.duration_store = None
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Reorder tests longest-first using historical median durations.
+
+    Without recording (--no-durations-db) the history is only read if it
+    already exists; no database is created.
+    """
+    if not config.getoption("longest_first"):
+        return
+    if config.duration_store:
+        medians = config.duration_store.median_test_durations()
+    elif os.path.exists(durations_db_path(config)):
+        store = DurationStore(durations_db_path(config))
+        medians = store.median_test_durations()
+        store.close()
+    else:
+        medians = {}
+    items.sort(key=lambda item: medians.get(item.nodeid, float("inf")), reverse=True)
 
 
 @pytest.fixture(scope="session")
-def api_session():
+def api_session(pytestconfig):
     """
     Provides a reusable API session for all API tests.
 
     - Uses a persistent `requests.Session` to improve performance.
     - Automatically injects authentication and default headers.
     - Scoped at the session level to avoid unnecessary re-creation.
+    - Records the duration of every request in the duration store.
 
     Returns:
         requests.Session: Configured session with authorization headers.
     """
-    session = requests.Session()
-    session.headers.update({
-        "Authorization": AUTH_TOKEN,
-        "Content-Type": "application/json"
-    })
+    session = make_session()
+
+    store = pytestconfig.duration_store
+    if store is not None:
+        session.hooks["response"].append(endpoint_hook(store))
+
     return session
 
 
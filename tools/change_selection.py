@@ -0,0 +1,242 @@
+import ast
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+
+# Files every test depends on: a change to any of them selects the full suite.
+# Only their own content counts; modules conftest.py imports are tracked per
+# test through tracing, so that e.g. api/client.py does not select UI tests.
+GLOBAL_DEPENDENCIES = ["conftest.py", "pytest.ini", "requirements.txt"]
+
+# Installed packages may live inside the repository (e.g. ./venv).
+IGNORED_DIRECTORIES = {"site-packages", "dist-packages", ".venv", "venv"}
+
+MAP_VERSION = 1
+
+
+class ChangeAwareSelector:
+    """
+    Pytest plugin implementing change-aware test selection.
+
+    While tests run, the repository files each test exercised are
+    recorded with `sys.setprofile`, combined with the modules its test
+    file imports (transitively) and the GLOBAL_DEPENDENCIES. Code of
+    registered pytest plugins (hooks run for every test) is not recorded.
+    The content hash of every dependency is stored in a JSON map on disk.
+
+    With `select=True`, only tests whose dependencies changed since they
+    were recorded, tests that failed last time and tests missing from the
+    map are run; all others are deselected.
+    """
+
+    def __init__(self, rootdir, map_path, select=False):
+        """
+        Args:
+            rootdir (str): Repository root; only files below it are tracked.
+            map_path (str): JSON file holding the dependency map.
+            select (bool): Deselect tests unaffected by changes.
+        """
+        self.rootdir = os.path.abspath(rootdir)
+        self.map_path = map_path
+        self.select = select
+        self.tests = self._load()
+        self.hashes = {}
+        self.imports = {}
+        self.called = set()
+        self.previous_profile = None
+        self.deselected_all = False
+        self.plugin_files = None
+
+    # ─────────────────────────────
+    # Persistence
+    # ─────────────────────────────
+
+    def _load(self):
+        try:
+            with open(self.map_path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MAP_VERSION:
+            return {}
+        return data.get("tests", {})
+
+    def save(self):
+        """Write the dependency map to disk."""
+        with open(self.map_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": MAP_VERSION, "tests": self.tests}, handle, indent=1, sort_keys=True)
+
+    # ─────────────────────────────
+    # Dependencies
+    # ─────────────────────────────
+
+    def file_hash(self, path):
+        """
+        Content hash of a repository file, cached for the session.
+
+        Args:
+            path (str): Path relative to the repository root.
+
+        Returns:
+            str | None: SHA-1 hex digest, or None if the file does not exist.
+        """
+        if path not in self.hashes:
+            try:
+                with open(os.path.join(self.rootdir, path), "rb") as handle:
+                    self.hashes[path] = hashlib.sha1(handle.read()).hexdigest()
+            except OSError:
+                self.hashes[path] = None
+        return self.hashes[path]
+
+    def _relative(self, filename):
+        path = os.path.abspath(filename)
+        if not path.startswith(self.rootdir + os.sep):
+            return None
+        relative = os.path.relpath(path, self.rootdir)
+        if IGNORED_DIRECTORIES.intersection(relative.split(os.sep)):
+            return None
+        return relative.replace(os.sep, "/")
+
+    def _module_path(self, module):
+        base = os.path.join(self.rootdir, *module.split("."))
+        for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                return self._relative(candidate)
+        return None
+
+    def static_imports(self, path):
+        """
+        Repository modules imported by a file, transitively.
+
+        Args:
+            path (str): Path relative to the repository root.
+
+        Returns:
+            set[str]: Paths of imported repository modules, including `path`.
+        """
+        if path in self.imports:
+            return self.imports[path]
+
+        self.imports[path] = found = {path}
+        try:
+            with open(os.path.join(self.rootdir, path), encoding="utf-8") as handle:
+                tree = ast.parse(handle.read(), path)
+        except (OSError, SyntaxError, ValueError):
+            return found
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for module in modules:
+                module_path = self._module_path(module)
+                if module_path:
+                    found |= self.static_imports(module_path)
+        return found
+
+    def is_affected(self, nodeid):
+        """
+        Whether a test has to run in selection mode.
+
+        Args:
+            nodeid (str): Pytest node ID.
+
+        Returns:
+            bool: True if the test is new, failed last time or any of its
+                  dependencies changed.
+        """
+        entry = self.tests.get(nodeid)
+        if entry is None or entry.get("failed"):
+            return True
+        return any(self.file_hash(path) != digest for path, digest in entry["deps"].items())
+
+    # ─────────────────────────────
+    # Tracing
+    # ─────────────────────────────
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            self.called.add(frame.f_code.co_filename)
+
+    def _start_tracing(self):
+        self.called = set()
+        self.previous_profile = sys.getprofile()
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+
+    def _stop_tracing(self):
+        sys.setprofile(self.previous_profile)
+        threading.setprofile(None)
+
+    # ─────────────────────────────
+    # Pytest hooks
+    # ─────────────────────────────
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.select:
+            return
+
+        selected, deselected = [], []
+        for item in items:
+            (selected if self.is_affected(item.nodeid) else deselected).append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+            self.deselected_all = not selected
+
+    def _registered_plugin_files(self, config):
+        files = set()
+        for plugin in config.pluginmanager.get_plugins():
+            target = plugin if inspect.ismodule(plugin) else type(plugin)
+            try:
+                files.add(self._relative(inspect.getfile(target)))
+            except TypeError:
+                continue
+        files.discard(None)
+        return files
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.plugin_files is None:
+            self.plugin_files = self._registered_plugin_files(item.config)
+        self._start_tracing()
+        try:
+            yield
+        finally:
+            self._stop_tracing()
+
+        paths = {
+            path for path in map(self._relative, self.called)
+            if path and path not in self.plugin_files and self.file_hash(path) is not None
+        }
+        paths |= self.static_imports(self._relative(str(item.path)))
+        paths.update(GLOBAL_DEPENDENCIES)
+        paths.discard(None)
+
+        entry = self.tests.setdefault(item.nodeid, {"failed": False})
+        entry["deps"] = {path: self.file_hash(path) for path in sorted(paths)}
+
+    def pytest_runtest_logreport(self, report):
+        entry = self.tests.setdefault(report.nodeid, {"failed": False, "deps": {}})
+        if report.when == "setup":
+            entry["failed"] = False
+        if report.failed:
+            entry["failed"] = True
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if not session.config.option.collectonly:
+            self.save()
+        # Nothing changed is a success, not "no tests collected" (exit code 5).
+        if self.deselected_all and exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            session.exitstatus = pytest.ExitCode.OK
@@ -0,0 +1,560 @@
+import argparse
+import math
+import os
+import platform
+import re
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+from config.settings import BASE_API_URL, DURATIONS_DB
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    python TEXT,
+    platform TEXT,
+    hostname TEXT,
+    git_commit TEXT,
+    base_api_url TEXT
+);
+
+CREATE TABLE IF NOT EXISTS test_durations (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS endpoint_durations (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    method TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    status_code INTEGER,
+    duration REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_test_durations_nodeid
+    ON test_durations (nodeid, run_id);
+
+CREATE INDEX IF NOT EXISTS idx_endpoint_durations_endpoint
+    ON endpoint_durations (method, endpoint, run_id);
+"""
+
+_ID_SEGMENT = re.compile(
+    r"/([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)(?=/|$)"
+)
+
+
+def normalize_endpoint(url):
+    """
+    Collapse a request URL into an endpoint template.
+
+    Employee IDs and numeric path segments are replaced with `{id}` so
+    that every GET /api/Employees/<uuid> call is aggregated together.
+
+    Args:
+        url (str): Absolute request URL.
+
+    Returns:
+        str: Path template, e.g. "/Prod/api/Employees/{id}".
+    """
+    return _ID_SEGMENT.sub("/{id}", urlparse(url).path)
+
+
+def collect_environment():
+    """
+    Collect metadata describing the environment of the current run.
+
+    Returns:
+        dict: Python version, platform, hostname, git commit and API URL.
+    """
+    try:
+        git_commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        git_commit = None
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "hostname": socket.gethostname(),
+        "git_commit": git_commit,
+        "base_api_url": BASE_API_URL,
+    }
+
+
+def mann_whitney_p(baseline, recent):
+    """
+    One-sided Mann-Whitney U test that `recent` is slower than `baseline`.
+
+    Uses the normal approximation with tie correction, which is adequate
+    for the sample sizes kept in the store and needs no third-party
+    dependencies.
+
+    Args:
+        baseline (list[float]): Historical durations.
+        recent (list[float]): Durations under test.
+
+    Returns:
+        float: p-value; small values indicate `recent` is stochastically larger.
+    """
+    n1, n2 = len(recent), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted(
+        [(value, 0) for value in recent] + [(value, 1) for value in baseline]
+    )
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = average_rank
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    n = n1 + n2
+    mean_u = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u - mean_u - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def robust_z_p(baseline, recent):
+    """
+    One-sided p-value of the recent median against a robust baseline.
+
+    The baseline spread is estimated with the median absolute deviation
+    (scaled to match a normal standard deviation), so a single slow
+    outlier in history does not mask a regression. Used when there are
+    too few recent samples for a rank test to reach significance.
+
+    Args:
+        baseline (list[float]): Historical durations.
+        recent (list[float]): Durations under test.
+
+    Returns:
+        float: p-value; small values indicate `recent` is slower.
+    """
+    if len(baseline) < 2 or not recent:
+        return 1.0
+
+    center = statistics.median(baseline)
+    mad = statistics.median(abs(value - center) for value in baseline) * 1.4826
+    # Floor the spread at 1% of the median so perfectly stable history
+    # does not turn microsecond jitter into infinite z-scores.
+    spread = max(mad, abs(center) * 0.01, 1e-9)
+
+    z = (statistics.median(recent) - center) / spread
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def shift_p_value(baseline, recent, min_rank_samples=5):
+    """
+    Pick the appropriate test for a duration shift.
+
+    Args:
+        baseline (list[float]): Historical durations.
+        recent (list[float]): Durations under test.
+        min_rank_samples (int): Minimum recent samples for the rank test.
+
+    Returns:
+        float: p-value that `recent` is slower than `baseline`.
+    """
+    if len(recent) >= min_rank_samples:
+        return mann_whitney_p(baseline, recent)
+    return robust_z_p(baseline, recent)
+
+
+class DurationStore:
+    """
+    DurationStore
+
+    Append-only SQLite store of test and endpoint durations.
+
+    Every pytest session opens one run, records the duration of each test
+    and each HTTP call made through the API session, and closes the run.
+    History is kept across runs so slowdowns can be detected and the
+    longest tests can be scheduled first.
+    """
+
+    def __init__(self, path=DURATIONS_DB):
+        """
+        Open (and create if needed) the duration store.
+
+        Args:
+            path (str): Location of the SQLite database file.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.run_id = None
+        self.metadata = {}
+
+    # ─────────────────────────────
+    # Recording
+    # ─────────────────────────────
+
+    def start_run(self, metadata=None):
+        """
+        Begin a new run.
+
+        The run row is only inserted when the first duration is recorded,
+        so invocations that execute no test (--help, --collect-only, every
+        test deselected) do not leave empty runs behind.
+
+        Args:
+            metadata (dict, optional): Environment metadata. Defaults to
+                                       `collect_environment()`.
+        """
+        self.run_id = None
+        self.metadata = metadata or collect_environment()
+
+    def _current_run(self):
+        if self.run_id is None:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, python, platform, hostname, git_commit, base_api_url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(),
+                    self.metadata.get("python"),
+                    self.metadata.get("platform"),
+                    self.metadata.get("hostname"),
+                    self.metadata.get("git_commit"),
+                    self.metadata.get("base_api_url"),
+                )
+            )
+            self.run_id = cursor.lastrowid
+        return self.run_id
+
+    def record_test(self, nodeid, outcome, duration):
+        """
+        Record the duration of a single test.
+
+        Args:
+            nodeid (str): Pytest node ID.
+            outcome (str): passed, failed, skipped, xfailed or xpassed.
+            duration (float): Duration in seconds.
+        """
+        self.connection.execute(
+            "INSERT INTO test_durations (run_id, nodeid, outcome, duration) VALUES (?, ?, ?, ?)",
+            (self._current_run(), nodeid, outcome, duration)
+        )
+
+    def record_endpoint(self, method, url, status_code, duration):
+        """
+        Record the duration of a single HTTP call.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL; normalized with `normalize_endpoint`.
+            status_code (int): Response status code.
+            duration (float): Duration in seconds.
+        """
+        self.connection.execute(
+            "INSERT INTO endpoint_durations (run_id, method, endpoint, status_code, duration) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self._current_run(), method, normalize_endpoint(url), status_code, duration)
+        )
+
+    def close(self):
+        """Commit pending rows and close the connection."""
+        self.connection.commit()
+        self.connection.close()
+
+    # ─────────────────────────────
+    # Queries
+    # ─────────────────────────────
+
+    def run_ids(self, base_api_url=None, hostname=None):
+        """
+        Return identifiers of runs that recorded durations, oldest first.
+
+        Args:
+            base_api_url (str, optional): Only runs against this API URL.
+            hostname (str, optional): Only runs executed on this host.
+
+        Returns:
+            list[int]: Run IDs.
+        """
+        query = (
+            "SELECT id FROM runs "
+            "WHERE (EXISTS (SELECT 1 FROM test_durations WHERE run_id = runs.id) "
+            "OR EXISTS (SELECT 1 FROM endpoint_durations WHERE run_id = runs.id))"
+        )
+        params = []
+        if base_api_url is not None:
+            query += " AND base_api_url = ?"
+            params.append(base_api_url)
+        if hostname is not None:
+            query += " AND hostname = ?"
+            params.append(hostname)
+        return [row[0] for row in self.connection.execute(query + " ORDER BY id", params)]
+
+    def run_environment(self, run_id):
+        """
+        Return the API URL and host a run was executed against.
+
+        Args:
+            run_id (int): Run identifier.
+
+        Returns:
+            tuple[str, str]: (base_api_url, hostname).
+        """
+        return self.connection.execute(
+            "SELECT base_api_url, hostname FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+
+    def test_history(self, run_ids):
+        """
+        Group test durations by node ID for the given runs.
+
+        Skipped tests are excluded since their duration says nothing
+        about the code under test.
+
+        Args:
+            run_ids (list[int]): Runs to include.
+
+        Returns:
+            dict[str, list[float]]: Durations per node ID.
+        """
+        return self._group(
+            "SELECT nodeid, duration FROM test_durations "
+            "WHERE outcome != 'skipped' AND run_id IN ({})",
+            run_ids
+        )
+
+    def endpoint_history(self, run_ids):
+        """
+        Group endpoint durations by "METHOD endpoint" for the given runs.
+
+        Args:
+            run_ids (list[int]): Runs to include.
+
+        Returns:
+            dict[str, list[float]]: Durations per endpoint.
+        """
+        return self._group(
+            "SELECT method || ' ' || endpoint, duration FROM endpoint_durations "
+            "WHERE run_id IN ({})",
+            run_ids
+        )
+
+    def median_test_durations(self, last_runs=20):
+        """
+        Median duration of each test over the most recent runs.
+
+        Used to schedule the longest tests first.
+
+        Args:
+            last_runs (int): Number of most recent runs to consider.
+
+        Returns:
+            dict[str, float]: Median duration per node ID.
+        """
+        history = self.test_history(self.run_ids()[-last_runs:])
+        return {nodeid: statistics.median(values) for nodeid, values in history.items()}
+
+    def _group(self, query, run_ids):
+        grouped = {}
+        if not run_ids:
+            return grouped
+        placeholders = ", ".join("?" * len(run_ids))
+        for key, duration in self.connection.execute(query.format(placeholders), run_ids):
+            grouped.setdefault(key, []).append(duration)
+        return grouped
+
+    # ─────────────────────────────
+    # Regression detection
+    # ─────────────────────────────
+
+    def compare(self, recent_runs=1, baseline_runs=20, alpha=0.01, min_ratio=1.2,
+                match_environment=True):
+        """
+        Flag tests and endpoints whose durations shifted against a rolling baseline.
+
+        The most recent `recent_runs` runs are compared with the
+        `baseline_runs` runs preceding them. A key is flagged when the
+        shift test (Mann-Whitney U, or a robust z-score for few recent
+        samples) rejects "not slower" at `alpha` AND the median grew by at
+        least `min_ratio`, so tiny but consistent shifts are not reported.
+
+        By default only runs with the same `base_api_url` and host as the
+        latest run are considered, so runs routed through the fault proxy
+        or executed on another machine do not skew the baseline.
+
+        Args:
+            recent_runs (int): Number of latest runs under test.
+            baseline_runs (int): Size of the rolling baseline window.
+            alpha (float): Significance level.
+            min_ratio (float): Minimum median slowdown to report.
+            match_environment (bool): Restrict runs to the environment of
+                                      the latest run.
+
+        Returns:
+            list[dict]: One entry per regression, slowest ratio first.
+        """
+        ids = self.run_ids()
+        if ids and match_environment:
+            ids = self.run_ids(*self.run_environment(ids[-1]))
+        recent_ids = ids[-recent_runs:]
+        baseline_ids = ids[-(recent_runs + baseline_runs):-recent_runs]
+
+        regressions = []
+        for kind, history in (
+            ("test", self.test_history),
+            ("endpoint", self.endpoint_history),
+        ):
+            baseline = history(baseline_ids)
+            recent = history(recent_ids)
+            for key, recent_values in recent.items():
+                baseline_values = baseline.get(key)
+                if not baseline_values:
+                    continue
+                baseline_median = statistics.median(baseline_values)
+                recent_median = statistics.median(recent_values)
+                ratio = recent_median / baseline_median if baseline_median else math.inf
+                p_value = shift_p_value(baseline_values, recent_values)
+                if p_value < alpha and ratio >= min_ratio:
+                    regressions.append({
+                        "kind": kind,
+                        "key": key,
+                        "baseline_median": baseline_median,
+                        "recent_median": recent_median,
+                        "ratio": ratio,
+                        "p_value": p_value,
+                    })
+
+        return sorted(regressions, key=lambda r: r["ratio"], reverse=True)
+
+
+def endpoint_hook(store):
+    """
+    Build a requests response hook recording every call in `store`.
+
+    Args:
+        store (DurationStore): Store with a started run.
+
+    Returns:
+        callable: Hook for `session.hooks["response"]`.
+    """
+    def record_duration(response, *args, **kwargs):
+        store.record_endpoint(
+            response.request.method,
+            response.request.url,
+            response.status_code,
+            response.elapsed.total_seconds()
+        )
+
+    return record_duration
+
+
+class DurationRecorder:
+    """
+    Pytest plugin feeding test durations into a DurationStore.
+
+    Setup, call and teardown durations are summed per test. The recorded
+    outcome is the call outcome, or the setup outcome when the test never
+    reached the call phase; xfail markers are reported as xfailed/xpassed.
+    """
+
+    def __init__(self, store):
+        """
+        Args:
+            store (DurationStore): Store with a started run.
+        """
+        self.store = store
+        self.pending = {}
+
+    def pytest_runtest_logreport(self, report):
+        entry = self.pending.setdefault(report.nodeid, {"duration": 0.0, "outcome": None})
+        entry["duration"] += report.duration
+
+        if report.when == "call" or (report.when == "setup" and report.outcome != "passed"):
+            entry["outcome"] = report.outcome
+            if hasattr(report, "wasxfail"):
+                entry["outcome"] = "xfailed" if report.outcome == "skipped" else "xpassed"
+
+        if report.when == "teardown":
+            entry = self.pending.pop(report.nodeid)
+            if report.failed:
+                entry["outcome"] = "failed"
+            self.store.record_test(report.nodeid, entry["outcome"] or report.outcome, entry["duration"])
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Usage:
+        python -m tools.duration_store compare [--recent 1] [--baseline 20]
+    """
+    parser = argparse.ArgumentParser(description="Historical test duration store")
+    parser.add_argument("--db", default=DURATIONS_DB, help="SQLite database path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compare = subparsers.add_parser("compare", help="Detect duration regressions")
+    compare.add_argument("--recent", type=int, default=1, help="Latest runs under test")
+    compare.add_argument("--baseline", type=int, default=20, help="Rolling baseline size")
+    compare.add_argument("--alpha", type=float, default=0.01, help="Significance level")
+    compare.add_argument("--min-ratio", type=float, default=1.2, help="Minimum median slowdown")
+    compare.add_argument("--any-environment", action="store_true",
+                         help="Compare runs from every API URL and host")
+
+    subparsers.add_parser("slowest", help="List tests by median duration")
+
+    args = parser.parse_args(argv)
+    store = DurationStore(args.db)
+
+    try:
+        if args.command == "slowest":
+            medians = store.median_test_durations()
+            for nodeid, median in sorted(medians.items(), key=lambda item: item[1], reverse=True):
+                print(f"{median:8.3f}s  {nodeid}")
+            return 0
+
+        regressions = store.compare(
+            args.recent, args.baseline, args.alpha, args.min_ratio,
+            match_environment=not args.any_environment
+        )
+        if not regressions:
+            print("No duration regressions detected.")
+            return 0
+
+        for regression in regressions:
+            print(
+                f"REGRESSION [{regression['kind']}] {regression['key']}: "
+                f"{regression['baseline_median']:.3f}s -> {regression['recent_median']:.3f}s "
+                f"(x{regression['ratio']:.2f}, p={regression['p_value']:.4f})"
+            )
+        return 1
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
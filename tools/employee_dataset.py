@@ -0,0 +1,240 @@
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from itertools import accumulate
+
+import requests
+
+from config.settings import BASE_API_URL
+
+
+FIRST_NAMES = [
+    ("James", 30), ("Mary", 28), ("Robert", 26), ("Patricia", 24), ("John", 24),
+    ("Jennifer", 22), ("Michael", 22), ("Linda", 20), ("David", 20), ("Elizabeth", 18),
+    ("Maria", 18), ("Jose", 14), ("Wei", 10), ("Aisha", 8), ("Olga", 6),
+    ("Sean", 6), ("Priya", 6), ("Hiroshi", 4), ("Fatima", 4), ("Lars", 3),
+]
+
+LAST_NAMES = [
+    ("Smith", 30), ("Johnson", 25), ("Williams", 22), ("Brown", 20), ("Jones", 20),
+    ("Garcia", 18), ("Miller", 16), ("Davis", 16), ("Rodriguez", 14), ("Martinez", 14),
+    ("Hernandez", 12), ("Lopez", 12), ("Nguyen", 10), ("Kim", 8), ("Patel", 8),
+    ("O'Brien", 4), ("Smith-Jones", 4), ("Van der Berg", 3), ("Kowalski", 3), ("Ivanova", 3),
+]
+
+UNICODE_NAMES = [
+    "José", "Zoë", "Björk", "Łukasz", "Ærø", "Søren", "François", "Nuñez",
+    "Müller", "Đorđević", "Παναγιώτης", "Дмитрий", "李小龍", "山田", "محمد", "😀Emoji",
+]
+
+# Realistic share of 0..6 dependants in a payroll population.
+DEPENDANT_WEIGHTS = [35, 20, 22, 12, 6, 3, 2]
+
+# Probability of each edge case per generated employee.
+EDGE_CASES = {
+    "leading_zero_dependants": 0.01,
+    "negative_dependants": 0.01,
+    "long_name": 0.005,
+    "unicode_name": 0.02,
+}
+
+LONG_NAME_LENGTH = 256
+
+
+def _weighted(rng, choices):
+    # Cumulative weights are computed once; rng.choices would otherwise
+    # rebuild them on every call, which dominates generation time.
+    values = [value for value, _ in choices]
+    cum_weights = list(accumulate(weight for _, weight in choices))
+    return lambda: rng.choices(values, cum_weights=cum_weights)[0]
+
+
+def generate_employees(count, seed=0):
+    """
+    Stream deterministic synthetic employee payloads.
+
+    The same `seed` and `count` always produce the same sequence, so a
+    failing dataset can be regenerated from those two numbers alone.
+    Employees are yielded one at a time and never held in memory.
+
+    Edge cases are mixed in at the rates defined in `EDGE_CASES`:
+        - Dependants sent as strings with leading zeros ("02").
+        - Negative dependants.
+        - Names of `LONG_NAME_LENGTH` characters.
+        - Non-ASCII names.
+
+    Args:
+        count (int): Number of employees to generate.
+        seed (int): Random seed.
+
+    Yields:
+        dict: Employee payload compliant with the Employees API contract.
+    """
+    rng = random.Random(seed)
+    first_name = _weighted(rng, FIRST_NAMES)
+    last_name = _weighted(rng, LAST_NAMES)
+    dependant_count = _weighted(rng, list(enumerate(DEPENDANT_WEIGHTS)))
+
+    for index in range(count):
+        employee_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        first = first_name()
+        last = last_name()
+        dependants = dependant_count()
+
+        if rng.random() < EDGE_CASES["unicode_name"]:
+            first = rng.choice(UNICODE_NAMES)
+        if rng.random() < EDGE_CASES["long_name"]:
+            last = (last * (LONG_NAME_LENGTH // len(last) + 1))[:LONG_NAME_LENGTH]
+        if rng.random() < EDGE_CASES["leading_zero_dependants"]:
+            dependants = f"0{dependants}"
+        elif rng.random() < EDGE_CASES["negative_dependants"]:
+            dependants = -rng.randint(1, 5)
+
+        yield {
+            "id": employee_id,
+            "firstName": first,
+            "lastName": last,
+            "username": f"user_{seed}_{index}",
+            "dependants": dependants,
+        }
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def write_ndjson(path, employees):
+    """
+    Write employees as compact newline-delimited JSON.
+
+    Paths ending in `.gz` are gzip-compressed.
+
+    Args:
+        path (str): Output file.
+        employees (Iterable[dict]): Employee payloads.
+
+    Returns:
+        int: Number of employees written.
+    """
+    written = 0
+    with _open(path, "w") as handle:
+        for employee in employees:
+            handle.write(json.dumps(employee, ensure_ascii=False, separators=(",", ":")))
+            handle.write("\n")
+            written += 1
+    return written
+
+
+def read_ndjson(path):
+    """
+    Stream employees back from an NDJSON (optionally `.gz`) file.
+
+    Args:
+        path (str): Input file.
+
+    Yields:
+        dict: Employee payload.
+    """
+    with _open(path, "r") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def feed(api, employees, rate=None, limit=None):
+    """
+    Replay employees into the API at a controlled rate.
+
+    Requests are paced against a monotonic schedule rather than sleeping a
+    fixed interval after each call, so slow responses do not lower the
+    overall rate. Only a status code counter is retained, keeping memory
+    constant regardless of dataset size. Requests that fail without a
+    response (timeouts, resets, connection errors) are counted under
+    "error" and the replay continues.
+
+    Args:
+        api (EmployeesAPI): Client used to create employees.
+        employees (Iterable[dict]): Employee payloads, e.g. `read_ndjson(path)`.
+        rate (float, optional): Requests per second. Unlimited when None.
+        limit (int, optional): Stop after this many employees.
+
+    Returns:
+        dict: Number of employees sent, elapsed seconds and status code counts.
+    """
+    interval = 1 / rate if rate else 0
+    status_codes = Counter()
+    start = time.monotonic()
+    sent = 0
+
+    for employee in employees:
+        if limit is not None and sent >= limit:
+            break
+
+        if interval:
+            delay = start + sent * interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        try:
+            status_codes[api.create_employee(employee).status_code] += 1
+        except requests.RequestException:
+            status_codes["error"] += 1
+        sent += 1
+
+    return {
+        "sent": sent,
+        "elapsed": time.monotonic() - start,
+        "status_codes": dict(status_codes),
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Usage:
+        python -m tools.employee_dataset generate employees.ndjson.gz --count 1000000 --seed 42
+        python -m tools.employee_dataset feed employees.ndjson.gz --rate 20 --limit 500 --timeout 10
+    """
+    parser = argparse.ArgumentParser(description="Synthetic employee dataset generator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", help="Write a seeded dataset")
+    generate.add_argument("path", help="Output file (.ndjson or .ndjson.gz)")
+    generate.add_argument("--count", type=int, default=1000, help="Number of employees")
+    generate.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    replay = subparsers.add_parser("feed", help="Replay a dataset into the Employees API")
+    replay.add_argument("path", help="Dataset file")
+    replay.add_argument("--rate", type=float, default=None, help="Requests per second")
+    replay.add_argument("--limit", type=int, default=None, help="Maximum employees to send")
+    replay.add_argument("--timeout", type=float, default=30, help="Timeout per request in seconds")
+    replay.add_argument("--base-url", default=BASE_API_URL, help="API base URL")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        written = write_ndjson(args.path, generate_employees(args.count, args.seed))
+        print(f"Wrote {written} employees to {args.path}")
+        return 0
+
+    from api.client import EmployeesAPI, make_session
+
+    api = EmployeesAPI(make_session(), base_url=args.base_url, timeout=args.timeout)
+    summary = feed(api, read_ndjson(args.path), args.rate, args.limit)
+    print(
+        f"Sent {summary['sent']} employees in {summary['elapsed']:.1f}s; "
+        f"status codes: {summary['status_codes']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,414 @@
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+
+import requests
+
+from config.settings import SNAPSHOTS_DB
+
+
+# Fields that identify the same person from a user's point of view. Two
+# records sharing them under different IDs are reported as duplicates
+# (see UI-01: the UI allows duplicate employees).
+IDENTITY_FIELDS = ("firstName", "lastName", "dependants")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    fingerprint BLOB PRIMARY KEY,
+    body TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    taken_at TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS snapshot_entries (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+    employee_id TEXT,
+    fingerprint BLOB NOT NULL REFERENCES records(fingerprint),
+    identity BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshot_entries_snapshot
+    ON snapshot_entries (snapshot_id);
+"""
+
+
+def _digest(value):
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+
+
+def canonical_json(record):
+    """
+    Serialize a record deterministically, independent of key order.
+
+    Args:
+        record (dict): Employee record.
+
+    Returns:
+        str: Compact JSON with sorted keys.
+    """
+    return json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def fingerprint(record):
+    """
+    Stable content hash of a full employee record.
+
+    Args:
+        record (dict): Employee record.
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest.
+    """
+    return _digest(canonical_json(record))
+
+
+def identity(record):
+    """
+    Hash of the fields in IDENTITY_FIELDS, used to detect duplicates.
+
+    Args:
+        record (dict): Employee record.
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest.
+    """
+    # repr keeps "02" and 2 apart and is much cheaper than a second json.dumps.
+    return _digest(repr(tuple(record.get(field) for field in IDENTITY_FIELDS)))
+
+
+class Snapshot:
+    """
+    Snapshot
+
+    In-memory view of one capture of GET /Employees.
+
+    Only 16-byte digests are held per employee; full record bodies stay
+    in the SnapshotStore, where each distinct record is stored once no
+    matter how many snapshots contain it.
+    """
+
+    def __init__(self):
+        self.fingerprints = {}
+        self.identities = {}
+        self.duplicate_ids = set()
+        self.missing_ids = 0
+
+    def add(self, employee_id, record_fingerprint, record_identity):
+        """
+        Add one employee to the snapshot.
+
+        Records without an ID cannot be matched across snapshots; they are
+        only counted in `missing_ids`.
+
+        Args:
+            employee_id (str | None): Employee ID.
+            record_fingerprint (bytes): Result of `fingerprint(record)`.
+            record_identity (bytes): Result of `identity(record)`.
+        """
+        if employee_id is None:
+            self.missing_ids += 1
+            return
+        if employee_id in self.fingerprints:
+            self.duplicate_ids.add(employee_id)
+        self.fingerprints[employee_id] = record_fingerprint
+        self.identities[employee_id] = record_identity
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a snapshot from employee records.
+
+        Args:
+            records (Iterable[dict]): Records as returned by GET /Employees.
+
+        Returns:
+            Snapshot: The snapshot.
+        """
+        snapshot = cls()
+        for record in records:
+            snapshot.add(record.get("id"), fingerprint(record), identity(record))
+        return snapshot
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def identity_groups(self):
+        """
+        Group employee IDs that share the same IDENTITY_FIELDS.
+
+        Returns:
+            dict[bytes, list[str]]: Employee IDs per identity hash.
+        """
+        groups = {}
+        for employee_id, record_identity in self.identities.items():
+            groups.setdefault(record_identity, []).append(employee_id)
+        return groups
+
+
+def diff_snapshots(old, new):
+    """
+    Compare two snapshots in linear time.
+
+    Args:
+        old (Snapshot): Earlier snapshot.
+        new (Snapshot): Later snapshot.
+
+    Returns:
+        dict: Sets of employee IDs that were added, removed or changed,
+              the IDs returned more than once in `new`, the duplicate
+              groups (employees sharing IDENTITY_FIELDS) that appeared or
+              grew since `old`, and the number of records in `new`
+              without an ID.
+    """
+    old_fingerprints = old.fingerprints
+    new_fingerprints = new.fingerprints
+
+    old_group_sizes = {
+        record_identity: len(ids) for record_identity, ids in old.identity_groups().items()
+    }
+    new_duplicates = sorted(
+        sorted(ids) for record_identity, ids in new.identity_groups().items()
+        if len(ids) > 1 and len(ids) > old_group_sizes.get(record_identity, 0)
+    )
+
+    return {
+        "added": new_fingerprints.keys() - old_fingerprints.keys(),
+        "removed": old_fingerprints.keys() - new_fingerprints.keys(),
+        "changed": {
+            employee_id for employee_id, record_fingerprint in new_fingerprints.items()
+            if employee_id in old_fingerprints
+            and old_fingerprints[employee_id] != record_fingerprint
+        },
+        "duplicate_ids": set(new.duplicate_ids),
+        "new_duplicates": new_duplicates,
+        "missing_ids": new.missing_ids,
+    }
+
+
+class SnapshotStore:
+    """
+    SnapshotStore
+
+    Content-addressed SQLite store of Employees snapshots.
+
+    Record bodies are keyed by fingerprint, so an employee that did not
+    change between captures is stored once; each snapshot only adds one
+    (employee ID, fingerprint, identity) row per employee.
+    """
+
+    def __init__(self, path=SNAPSHOTS_DB):
+        """
+        Open (and create if needed) the snapshot store.
+
+        Args:
+            path (str): Location of the SQLite database file.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def save(self, records):
+        """
+        Store a snapshot of employee records.
+
+        Args:
+            records (list[dict]): Records as returned by GET /Employees.
+
+        Returns:
+            int: Identifier of the new snapshot.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO snapshots (taken_at, size) VALUES (?, ?)",
+                (datetime.now(timezone.utc).isoformat(), len(records))
+            )
+            snapshot_id = cursor.lastrowid
+
+            entries = []
+            bodies = []
+            for record in records:
+                body = canonical_json(record)
+                record_fingerprint = _digest(body)
+                bodies.append((record_fingerprint, body))
+                entries.append((snapshot_id, record.get("id"), record_fingerprint, identity(record)))
+
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO records (fingerprint, body) VALUES (?, ?)", bodies
+            )
+            self.connection.executemany(
+                "INSERT INTO snapshot_entries (snapshot_id, employee_id, fingerprint, identity) "
+                "VALUES (?, ?, ?, ?)",
+                entries
+            )
+        return snapshot_id
+
+    def load(self, snapshot_id):
+        """
+        Load a snapshot without reading record bodies.
+
+        Args:
+            snapshot_id (int): Snapshot identifier.
+
+        Returns:
+            Snapshot: The snapshot.
+        """
+        snapshot = Snapshot()
+        rows = self.connection.execute(
+            "SELECT employee_id, fingerprint, identity FROM snapshot_entries WHERE snapshot_id = ?",
+            (snapshot_id,)
+        )
+        for employee_id, record_fingerprint, record_identity in rows:
+            snapshot.add(employee_id, record_fingerprint, record_identity)
+        return snapshot
+
+    def record(self, record_fingerprint):
+        """
+        Fetch the full body of a record.
+
+        Args:
+            record_fingerprint (bytes): Record fingerprint.
+
+        Returns:
+            dict | None: The record, or None if unknown.
+        """
+        row = self.connection.execute(
+            "SELECT body FROM records WHERE fingerprint = ?", (record_fingerprint,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def snapshots(self):
+        """
+        List stored snapshots, oldest first.
+
+        Returns:
+            list[tuple]: (id, taken_at, size) per snapshot.
+        """
+        return self.connection.execute(
+            "SELECT id, taken_at, size FROM snapshots ORDER BY id"
+        ).fetchall()
+
+    def close(self):
+        """Close the connection."""
+        self.connection.close()
+
+
+def capture(api, store, count=1, interval=60):
+    """
+    Capture GET /Employees periodically into the store.
+
+    A failed capture (request error, non-200 status or invalid body) is
+    reported on stderr and skipped; capturing continues at the next
+    interval, since a flaky backend is exactly what is being audited.
+
+    Args:
+        api (EmployeesAPI): Client used to list employees; give it a timeout.
+        store (SnapshotStore): Destination store.
+        count (int): Number of snapshots to attempt.
+        interval (float): Seconds between snapshots.
+
+    Returns:
+        list[int]: Identifiers of the stored snapshots.
+    """
+    snapshot_ids = []
+    for index in range(count):
+        if index:
+            time.sleep(interval)
+        try:
+            response = api.get_employees()
+            response.raise_for_status()
+            records = response.json()
+            if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+                raise ValueError("expected a JSON list of employee objects")
+        except (requests.RequestException, ValueError) as error:
+            print(f"Capture {index + 1}/{count} failed: {error}", file=sys.stderr)
+            continue
+        snapshot_ids.append(store.save(records))
+        print(f"Captured snapshot {snapshot_ids[-1]} ({len(records)} employees)")
+    return snapshot_ids
+
+
+def _print_diff(store, old, new, result, limit):
+    print(
+        f"added: {len(result['added'])}  removed: {len(result['removed'])}  "
+        f"changed: {len(result['changed'])}  duplicate ids: {len(result['duplicate_ids'])}  "
+        f"new duplicates: {len(result['new_duplicates'])}  without id: {result['missing_ids']}"
+    )
+    old_groups = {}
+    if result["new_duplicates"]:
+        old_groups = old.identity_groups()
+    for label in ("added", "removed", "changed", "duplicate_ids"):
+        for employee_id in sorted(result[label], key=str)[:limit]:
+            print(f"  {label:<14} {employee_id}")
+    for ids in result["new_duplicates"][:limit]:
+        record = store.record(new.fingerprints[ids[0]])
+        fields = {field: record.get(field) for field in IDENTITY_FIELDS} if record else {}
+        previous = len(old_groups.get(new.identities[ids[0]], []))
+        print(f"  {'duplicate':<14} {fields} x{previous} -> x{len(ids)}")
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Usage:
+        python -m tools.employee_snapshots capture --count 10 --interval 60 --timeout 30
+        python -m tools.employee_snapshots list
+        python -m tools.employee_snapshots diff [OLD NEW]
+    """
+    parser = argparse.ArgumentParser(description="Employees snapshot differ")
+    parser.add_argument("--db", default=SNAPSHOTS_DB, help="SQLite database path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    capture_parser = subparsers.add_parser("capture", help="Capture GET /Employees snapshots")
+    capture_parser.add_argument("--count", type=int, default=1, help="Number of snapshots")
+    capture_parser.add_argument("--interval", type=float, default=60, help="Seconds between snapshots")
+    capture_parser.add_argument("--timeout", type=float, default=30, help="Timeout per request in seconds")
+
+    subparsers.add_parser("list", help="List stored snapshots")
+
+    diff_parser = subparsers.add_parser("diff", help="Diff two snapshots (default: latest two)")
+    diff_parser.add_argument("snapshots", nargs="*", type=int, help="OLD NEW snapshot IDs")
+    diff_parser.add_argument("--limit", type=int, default=20, help="IDs listed per category")
+
+    args = parser.parse_args(argv)
+    store = SnapshotStore(args.db)
+
+    try:
+        if args.command == "capture":
+            from api.client import EmployeesAPI, make_session
+
+            api = EmployeesAPI(make_session(), timeout=args.timeout)
+            snapshot_ids = capture(api, store, args.count, args.interval)
+            return 0 if snapshot_ids else 1
+
+        if args.command == "list":
+            for snapshot_id, taken_at, size in store.snapshots():
+                print(f"{snapshot_id:>5}  {taken_at}  {size} employees")
+            return 0
+
+        stored_ids = [row[0] for row in store.snapshots()]
+        snapshot_ids = args.snapshots or stored_ids[-2:]
+        if len(snapshot_ids) != 2:
+            parser.error("diff expects two snapshot IDs (or at least two stored snapshots)")
+        unknown = [snapshot_id for snapshot_id in snapshot_ids if snapshot_id not in stored_ids]
+        if unknown:
+            parser.error(f"unknown snapshot ID(s): {', '.join(map(str, unknown))}; see 'list'")
+        old_id, new_id = snapshot_ids
+
+        old, new = store.load(old_id), store.load(new_id)
+        _print_diff(store, old, new, diff_snapshots(old, new), args.limit)
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
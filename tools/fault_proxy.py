@@ -0,0 +1,410 @@
+import argparse
+import http.client
+import math
+import random
+import socket
+import statistics
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from config.settings import STAGE_PATH, UPSTREAM_URL
+
+
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "content-length", "host",
+}
+
+
+class FaultProfile:
+    """
+    FaultProfile
+
+    Describes the faults the proxy injects into every request.
+
+    Latency is drawn from one of the following distributions (milliseconds):
+        - ("constant", value)
+        - ("uniform", low, high)
+        - ("lognormal", median, sigma): long-tailed, closest to real networks.
+    """
+
+    def __init__(self, name, latency=("constant", 0), bandwidth_kib_s=None,
+                 reset_rate=0.0, error_rate=0.0, burst_length=1, error_status=503):
+        """
+        Args:
+            name (str): Profile name.
+            latency (tuple): Latency distribution, see class docstring.
+            bandwidth_kib_s (float, optional): Response bandwidth limit in KiB/s.
+            reset_rate (float): Probability of resetting the connection.
+            error_rate (float): Probability of starting a burst of 5xx responses.
+            burst_length (int): Consecutive requests answered with `error_status`.
+            error_status (int): 5xx status code returned during a burst.
+        """
+        self.name = name
+        self.latency = latency
+        self.bandwidth_kib_s = bandwidth_kib_s
+        self.reset_rate = reset_rate
+        self.error_rate = error_rate
+        self.burst_length = burst_length
+        self.error_status = error_status
+
+    def sample_latency(self, rng):
+        """
+        Draw a latency in seconds.
+
+        Args:
+            rng (random.Random): Random source.
+
+        Returns:
+            float: Latency in seconds.
+        """
+        kind, *params = self.latency
+        if kind == "constant":
+            milliseconds = params[0]
+        elif kind == "uniform":
+            milliseconds = rng.uniform(*params)
+        elif kind == "lognormal":
+            median, sigma = params
+            milliseconds = rng.lognormvariate(math.log(median), sigma) if median > 0 else 0
+        else:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        return max(milliseconds, 0) / 1000
+
+
+PROFILES = {
+    "baseline": FaultProfile("baseline"),
+    "slow": FaultProfile("slow", latency=("lognormal", 800, 0.5)),
+    "jittery": FaultProfile("jittery", latency=("uniform", 0, 3000)),
+    "narrowband": FaultProfile("narrowband", latency=("constant", 150), bandwidth_kib_s=16),
+    "resets": FaultProfile("resets", reset_rate=0.1),
+    "5xx-bursts": FaultProfile("5xx-bursts", error_rate=0.05, burst_length=5),
+    "degraded": FaultProfile(
+        "degraded", latency=("lognormal", 400, 1.0), bandwidth_kib_s=64,
+        reset_rate=0.03, error_rate=0.02, burst_length=3
+    ),
+}
+
+
+class FaultInjectingHandler(BaseHTTPRequestHandler):
+    """
+    Reverse proxy request handler forwarding to the upstream origin.
+
+    Each request is delayed according to the profile, then either reset,
+    answered with a 5xx from the current burst, or forwarded upstream
+    with the response body throttled to the configured bandwidth.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._proxy()
+
+    do_POST = do_PUT = do_DELETE = do_PATCH = do_HEAD = do_OPTIONS = do_GET
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _proxy(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+
+        with server.lock:
+            latency = server.profile.sample_latency(server.rng)
+            reset = server.rng.random() < server.profile.reset_rate
+            if not reset and server.burst_remaining == 0 \
+                    and server.rng.random() < server.profile.error_rate:
+                server.burst_remaining = server.profile.burst_length
+            error = not reset and server.burst_remaining > 0
+            if error:
+                server.burst_remaining -= 1
+
+        time.sleep(latency)
+
+        if reset:
+            self._reset_connection()
+            return
+
+        if error:
+            self._respond(server.profile.error_status, [("Content-Type", "text/plain")],
+                          b"Injected fault")
+            return
+
+        status, headers, payload = self._forward(body)
+        self._respond(status, headers, payload)
+
+    def _forward(self, body):
+        upstream = self.server.upstream
+        connection_class = (
+            http.client.HTTPSConnection if upstream.scheme == "https" else http.client.HTTPConnection
+        )
+        connection = connection_class(upstream.netloc, timeout=self.server.upstream_timeout)
+        headers = {
+            key: value for key, value in self.headers.items()
+            if key.lower() not in HOP_BY_HOP_HEADERS
+        }
+        headers["Host"] = upstream.netloc
+
+        try:
+            connection.request(self.command, self.path, body=body, headers=headers)
+            response = connection.getresponse()
+            payload = response.read()
+            return response.status, self._rewrite_headers(response.getheaders()), payload
+        except (OSError, http.client.HTTPException) as error:
+            return 502, [("Content-Type", "text/plain")], f"Upstream error: {error}".encode()
+        finally:
+            connection.close()
+
+    def _rewrite_headers(self, headers):
+        # Keep redirects pointing at the proxy instead of the upstream origin.
+        origin = f"{self.server.upstream.scheme}://{self.server.upstream.netloc}"
+        proxy_origin = f"http://{self.headers.get('Host', '')}"
+        rewritten = []
+        for key, value in headers:
+            if key.lower() in HOP_BY_HOP_HEADERS:
+                # HEAD responses carry no body, so the upstream length must be kept.
+                if not (key.lower() == "content-length" and self.command == "HEAD"):
+                    continue
+            if key.lower() == "location" and value.startswith(origin):
+                value = proxy_origin + value[len(origin):]
+            rewritten.append((key, value))
+        return rewritten
+
+    def _respond(self, status, headers, payload):
+        try:
+            self.send_response(status)
+            for key, value in headers:
+                self.send_header(key, value)
+            if not any(key.lower() == "content-length" for key, _ in headers):
+                self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self._write_throttled(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (e.g. its timeout expired during injected latency).
+            self.close_connection = True
+
+    def _write_throttled(self, payload):
+        bandwidth_kib_s = self.server.profile.bandwidth_kib_s
+        if not bandwidth_kib_s:
+            self.wfile.write(payload)
+            return
+
+        # Send a chunk every 50 ms so the limit holds for small bodies too.
+        chunk_size = max(int(bandwidth_kib_s * 1024 * 0.05), 1)
+        for offset in range(0, len(payload), chunk_size):
+            self.wfile.write(payload[offset:offset + chunk_size])
+            self.wfile.flush()
+            time.sleep(0.05)
+
+    def _reset_connection(self):
+        # SO_LINGER with a zero timeout makes close() send a TCP RST.
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.close_connection = True
+        self.connection.close()
+
+    def finish(self):
+        try:
+            super().finish()
+        except (OSError, ValueError):
+            pass
+
+
+class FaultProxy(ThreadingHTTPServer):
+    """
+    FaultProxy
+
+    Local HTTP reverse proxy that injects latency, bandwidth limits,
+    connection resets and 5xx bursts in front of the Benefits Dashboard.
+
+    Point the test suite at it by overriding the settings, e.g.:
+        BASE_API_URL=http://127.0.0.1:8080/Prod
+        BASE_UI_URL=http://127.0.0.1:8080/Prod/Account/Login
+    """
+
+    daemon_threads = True
+
+    def __init__(self, profile, upstream=UPSTREAM_URL, host="127.0.0.1", port=8080,
+                 seed=None, upstream_timeout=30, verbose=False):
+        """
+        Args:
+            profile (FaultProfile): Faults to inject.
+            upstream (str): Origin requests are forwarded to.
+            host (str): Interface to listen on.
+            port (int): Port to listen on; 0 picks a free port.
+            seed (int, optional): Seed for reproducible fault sequences.
+            upstream_timeout (float): Timeout for upstream requests in seconds.
+            verbose (bool): Log every proxied request.
+        """
+        super().__init__((host, port), FaultInjectingHandler)
+        self.profile = profile
+        self.upstream = urlparse(upstream)
+        self.upstream_timeout = upstream_timeout
+        self.verbose = verbose
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.burst_remaining = 0
+
+    @property
+    def url(self):
+        """
+        str: Origin of the proxy, e.g. "http://127.0.0.1:8080".
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Serve requests on a background thread.
+
+        Returns:
+            FaultProxy: The running proxy.
+        """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the listening socket."""
+        self.shutdown()
+        self.server_close()
+
+
+def run_resilience_benchmark(profile, requests_count=50, workers=4, timeout=5,
+                             max_retries=2, seed=0, upstream=UPSTREAM_URL, stage_path=STAGE_PATH):
+    """
+    Measure how EmployeesAPI behaves behind a fault profile.
+
+    A proxy is started with `profile` and GET /api/Employees is called
+    `requests_count` times from `workers` threads. 5xx responses and
+    connection errors are retried up to `max_retries` times.
+
+    Args:
+        profile (FaultProfile): Faults to inject.
+        requests_count (int): Number of logical requests.
+        workers (int): Concurrent client threads.
+        timeout (float): Client timeout per attempt in seconds.
+        max_retries (int): Retries per logical request.
+        seed (int): Seed for the proxy fault sequence.
+        upstream (str): Origin behind the proxy.
+        stage_path (str): Path prefix of the API on `upstream`.
+
+    Returns:
+        dict: Throughput, latency percentiles, retries, timeouts and failures.
+    """
+    import requests
+    from api.client import EmployeesAPI, make_session
+
+    proxy = FaultProxy(profile, upstream=upstream, port=0, seed=seed).start()
+    base_url = proxy.url + stage_path
+    local = threading.local()
+
+    def call(_):
+        if not hasattr(local, "api"):
+            local.api = EmployeesAPI(make_session(), base_url=base_url, timeout=timeout)
+
+        result = {"retries": 0, "timeouts": 0, "ok": False}
+        started = time.monotonic()
+        for attempt in range(max_retries + 1):
+            result["retries"] = attempt
+            try:
+                response = local.api.get_employees()
+            except requests.Timeout:
+                result["timeouts"] += 1
+                continue
+            except requests.ConnectionError:
+                continue
+            if response.status_code < 500:
+                result["ok"] = response.status_code == 200
+                break
+        result["latency"] = time.monotonic() - started
+        return result
+
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(call, range(requests_count)))
+    finally:
+        proxy.stop()
+    elapsed = time.monotonic() - started
+
+    latencies = sorted(result["latency"] for result in results)
+    return {
+        "profile": profile.name,
+        "requests": requests_count,
+        "succeeded": sum(result["ok"] for result in results),
+        "retries": sum(result["retries"] for result in results),
+        "timeouts": sum(result["timeouts"] for result in results),
+        "throughput": sum(result["ok"] for result in results) / elapsed if elapsed else 0,
+        "p50": statistics.median(latencies) if latencies else 0,
+        "p95": latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] if latencies else 0,
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Usage:
+        python -m tools.fault_proxy serve --profile slow --port 8080
+        python -m tools.fault_proxy benchmark --profiles baseline slow resets --upstream http://localhost:5000
+    """
+    parser = argparse.ArgumentParser(description="Latency and fault-injection proxy")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("serve", help="Run the proxy in the foreground")
+    serve.add_argument("--profile", choices=PROFILES, default="baseline")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--seed", type=int, default=None)
+    serve.add_argument("--verbose", action="store_true")
+    serve.add_argument("--upstream", default=UPSTREAM_URL, help="Origin to forward requests to")
+
+    benchmark = subparsers.add_parser("benchmark", help="Run the resilience benchmark matrix")
+    benchmark.add_argument("--profiles", nargs="+", choices=PROFILES, default=list(PROFILES))
+    benchmark.add_argument("--requests", type=int, default=50)
+    benchmark.add_argument("--workers", type=int, default=4)
+    benchmark.add_argument("--timeout", type=float, default=5)
+    benchmark.add_argument("--retries", type=int, default=2)
+    benchmark.add_argument("--seed", type=int, default=0)
+    benchmark.add_argument("--upstream", default=UPSTREAM_URL, help="Origin behind the proxy")
+    benchmark.add_argument("--stage-path", default=STAGE_PATH, help="Path prefix of the API on the upstream")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        proxy = FaultProxy(PROFILES[args.profile], upstream=args.upstream, port=args.port,
+                           seed=args.seed, verbose=args.verbose)
+        print(f"Proxying {args.upstream} at {proxy.url} with profile '{args.profile}'")
+        print(f"  BASE_API_URL={proxy.url}{STAGE_PATH}")
+        print(f"  BASE_UI_URL={proxy.url}{STAGE_PATH}/Account/Login")
+        try:
+            proxy.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            proxy.server_close()
+        return 0
+
+    header = f"{'profile':<12} {'ok':>9} {'retries':>8} {'timeouts':>9} {'req/s':>7} {'p50 s':>7} {'p95 s':>7}"
+    print(header)
+    print("-" * len(header))
+    for name in args.profiles:
+        result = run_resilience_benchmark(
+            PROFILES[name], args.requests, args.workers, args.timeout, args.retries, args.seed,
+            args.upstream, args.stage_path,
+        )
+        print(
+            f"{result['profile']:<12} {result['succeeded']:>4}/{result['requests']:<4} "
+            f"{result['retries']:>8} {result['timeouts']:>9} {result['throughput']:>7.2f} "
+            f"{result['p50']:>7.2f} {result['p95']:>7.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+from tools.change_selection import ChangeAwareSelector
+
+
+def write(root, path, content):
+    """
+    Write a file below `root`, creating parent directories.
+    """
+    target = root / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content)
+
+
+def test_static_imports_are_transitive(tmp_path):
+    """
+    Verify that modules imported by imported modules are tracked.
+    """
+    write(tmp_path, "api/client.py", "from config.settings import BASE_API_URL\n")
+    write(tmp_path, "config/settings.py", "BASE_API_URL = ''\n")
+    write(tmp_path, "api/test_employees_api.py", "import uuid\nfrom api.client import EmployeesAPI\n")
+
+    selector = ChangeAwareSelector(str(tmp_path), str(tmp_path / "map.json"))
+
+    assert selector.static_imports("api/test_employees_api.py") == {
+        "api/test_employees_api.py", "api/client.py", "config/settings.py"
+    }
+
+
+def test_only_tests_with_changed_dependencies_are_affected(tmp_path):
+    """
+    Verify selection against a saved map after one dependency changes.
+    """
+    write(tmp_path, "api/client.py", "v1")
+    write(tmp_path, "ui/pages/login_page.py", "v1")
+    map_path = str(tmp_path / "map.json")
+
+    recorder = ChangeAwareSelector(str(tmp_path), map_path)
+    recorder.tests = {
+        "api::test_api": {"failed": False, "deps": {"api/client.py": recorder.file_hash("api/client.py")}},
+        "ui::test_ui": {"failed": False, "deps": {"ui/pages/login_page.py": recorder.file_hash("ui/pages/login_page.py")}},
+        "ui::test_flaky": {"failed": True, "deps": {}},
+    }
+    recorder.save()
+
+    write(tmp_path, "api/client.py", "v2")
+    selector = ChangeAwareSelector(str(tmp_path), map_path, select=True)
+
+    assert selector.is_affected("api::test_api")
+    assert not selector.is_affected("ui::test_ui")
+    assert selector.is_affected("ui::test_flaky")
+    assert selector.is_affected("ui::test_new")
+
+
+def test_plugin_selects_only_affected_tests(pytester):
+    """
+    Verify record -> edit file -> --changed-only end to end, including
+    previously failing tests and the --full-run escape hatch.
+    """
+    pytester.makeconftest("""
+        import os
+        from tools.change_selection import ChangeAwareSelector
+
+        def pytest_addoption(parser):
+            parser.addoption("--changed-only", action="store_true")
+            parser.addoption("--full-run", action="store_true")
+
+        def pytest_configure(config):
+            select = config.getoption("changed_only") and not config.getoption("full_run")
+            map_path = os.path.join(str(config.rootpath), ".testmap.json")
+            config.pluginmanager.register(
+                ChangeAwareSelector(str(config.rootpath), map_path, select)
+            )
+    """)
+    pytester.makeini("[pytest]")
+    pytester.mkpydir("calc")
+    pytester.makepyfile(**{
+        "calc/adding": "def add(a, b):\n    return a + b\n",
+        "calc/multiplying": "def mul(a, b):\n    return a * b\n",
+        "test_adding": "from calc.adding import add\n\ndef test_add():\n    assert add(1, 2) == 3\n",
+        "test_multiplying": (
+            "import os\nfrom calc.multiplying import mul\n\n"
+            "def test_mul():\n    assert not os.path.exists('fail') and mul(2, 2) == 4\n"
+        ),
+    })
+
+    def run(*args):
+        return pytester.runpytest_inprocess("-p", "no:cacheprovider", *args)
+
+    run().assert_outcomes(passed=2)
+
+    result = run("--changed-only")
+    result.assert_outcomes(deselected=2)
+    assert result.ret == 0
+
+    pytester.path.joinpath("calc", "adding.py").write_text("def add(a, b):\n    return b + a\n")
+    result = run("--changed-only", "-v")
+    result.stdout.fnmatch_lines(["*test_add PASSED*"])
+    result.assert_outcomes(passed=1, deselected=1)
+
+    pytester.path.joinpath("fail").write_text("")
+    run().assert_outcomes(passed=1, failed=1)
+    pytester.path.joinpath("fail").unlink()
+
+    run("--changed-only", "-v").stdout.fnmatch_lines(["*test_mul PASSED*", "*1 passed, 1 deselected*"])
+    run("--changed-only").assert_outcomes(deselected=2)
+
+    run("--changed-only", "--full-run").assert_outcomes(passed=2)
+
+
+def test_conftest_imports_are_not_global(pytester):
+    """
+    Verify that editing a module conftest.py imports (like api/client.py)
+    only reselects the tests that use it, not the UI tests.
+    """
+    pytester.makeconftest("""
+        import os
+        import pytest
+        from backend.client import make_session
+        from tools.change_selection import ChangeAwareSelector
+
+        def pytest_addoption(parser):
+            parser.addoption("--changed-only", action="store_true")
+
+        def pytest_configure(config):
+            map_path = os.path.join(str(config.rootpath), ".testmap.json")
+            config.pluginmanager.register(
+                ChangeAwareSelector(str(config.rootpath), map_path, config.getoption("changed_only"))
+            )
+
+        @pytest.fixture(scope="session")
+        def api_session():
+            return make_session()
+    """)
+    pytester.makeini("[pytest]")
+    pytester.mkpydir("backend")
+    pytester.mkpydir("screens")
+    pytester.makepyfile(**{
+        "backend/client": "def make_session():\n    return {}\n",
+        "screens/login_page": "def title():\n    return 'Login'\n",
+        "test_backend_api": "def test_api(api_session):\n    assert api_session == {}\n",
+        "test_login_ui": (
+            "from screens.login_page import title\n\n"
+            "def test_title():\n    assert title() == 'Login'\n\n"
+            "def test_title_case():\n    assert title().istitle()\n"
+        ),
+    })
+
+    def run(*args):
+        return pytester.runpytest_inprocess("-p", "no:cacheprovider", *args)
+
+    run().assert_outcomes(passed=3)
+
+    pytester.path.joinpath("backend", "client.py").write_text("def make_session():\n    return dict()\n")
+    result = run("--changed-only", "-v")
+    result.stdout.fnmatch_lines(["*test_api PASSED*"])
+    result.assert_outcomes(passed=1, deselected=2)
@@ -0,0 +1,177 @@
+from datetime import timedelta
+
+import requests
+
+from tools.duration_store import DurationStore, endpoint_hook, normalize_endpoint
+
+
+def record_runs(store, durations, base_api_url="https://host/Prod"):
+    """
+    Record one run per duration for a single test and endpoint.
+
+    Args:
+        store (DurationStore): Target store.
+        durations (list[float]): Duration of each run, oldest first.
+        base_api_url (str): API URL stored in the run metadata.
+    """
+    for duration in durations:
+        store.start_run({"python": "3.11", "hostname": "ci", "base_api_url": base_api_url})
+        store.record_test("api/test_employees_api.py::test_get_employees", "passed", duration)
+        store.record_endpoint("GET", "https://host/Prod/api/Employees", 200, duration / 10)
+
+
+def test_normalize_endpoint_collapses_employee_ids():
+    """
+    Verify that employee IDs are aggregated under a single endpoint.
+    """
+    url = "https://host/Prod/api/Employees/3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+    assert normalize_endpoint(url) == "/Prod/api/Employees/{id}"
+
+
+def test_compare_flags_slow_test(tmp_path):
+    """
+    Verify that a clear slowdown against the rolling baseline is reported.
+    """
+    store = DurationStore(str(tmp_path / "durations.db"))
+    record_runs(store, [1.0, 1.02, 0.98, 1.01, 0.99, 1.03, 0.97, 1.0, 3.0])
+
+    regressions = store.compare(recent_runs=1, baseline_runs=8)
+
+    assert {r["kind"] for r in regressions} == {"test", "endpoint"}
+    assert all(r["ratio"] > 2 for r in regressions)
+
+
+def test_compare_ignores_stable_history(tmp_path):
+    """
+    Verify that normal jitter is not reported as a regression.
+    """
+    store = DurationStore(str(tmp_path / "durations.db"))
+    record_runs(store, [1.0, 1.02, 0.98, 1.01, 0.99, 1.03, 0.97, 1.0, 1.02])
+
+    assert store.compare(recent_runs=1, baseline_runs=8) == []
+
+
+def test_median_test_durations(tmp_path):
+    """
+    Verify that historical medians are available for longest-first scheduling.
+    """
+    store = DurationStore(str(tmp_path / "durations.db"))
+    record_runs(store, [1.0, 2.0, 3.0])
+
+    assert store.median_test_durations() == {
+        "api/test_employees_api.py::test_get_employees": 2.0
+    }
+
+
+def test_runs_without_durations_are_ignored(tmp_path):
+    """
+    Verify that runs recording nothing (--collect-only, --help, all tests
+    deselected) do not become the "recent" window of a comparison.
+    """
+    store = DurationStore(str(tmp_path / "durations.db"))
+    record_runs(store, [1.0, 1.02, 0.98, 1.01, 0.99, 1.03, 0.97, 1.0, 3.0])
+    for _ in range(3):
+        store.start_run({"python": "3.11", "hostname": "ci"})
+
+    assert len(store.run_ids()) == 9
+    assert store.compare(recent_runs=1, baseline_runs=8) != []
+
+
+def test_compare_only_uses_runs_from_the_same_environment(tmp_path):
+    """
+    Verify that runs through the fault proxy neither regress nor feed the baseline.
+    """
+    store = DurationStore(str(tmp_path / "durations.db"))
+    record_runs(store, [1.0, 1.02, 0.98, 1.01, 0.99, 1.03, 0.97, 1.0])
+    record_runs(store, [5.0], base_api_url="http://127.0.0.1:8080/Prod")
+
+    assert store.compare(recent_runs=1, baseline_runs=8) == []
+    assert store.compare(recent_runs=1, baseline_runs=8, match_environment=False) != []
+
+    record_runs(store, [1.01])
+
+    assert store.compare(recent_runs=1, baseline_runs=8) == []
+
+
+def test_endpoint_hook_records_response_duration(tmp_path):
+    """
+    Verify that the api_session response hook stores method, endpoint and timing.
+    """
+    store = DurationStore(str(tmp_path / "durations.db"))
+    store.start_run({"python": "3.11"})
+
+    response = requests.Response()
+    response.request = requests.Request(
+        "DELETE", "https://host/Prod/api/Employees/3fa85f64-5717-4562-b3fc-2c963f66afa6"
+    ).prepare()
+    response.status_code = 200
+    response.elapsed = timedelta(milliseconds=250)
+
+    endpoint_hook(store)(response)
+
+    assert store.endpoint_history(store.run_ids()) == {
+        "DELETE /Prod/api/Employees/{id}": [0.25]
+    }
+
+
+def test_duration_recorder_maps_outcomes(pytester, tmp_path):
+    """
+    Verify the outcomes recorded for passing, xfail, xpass, setup and
+    teardown errors.
+    """
+    db = tmp_path / "durations.db"
+    pytester.makeconftest(f"""
+        from tools.duration_store import DurationRecorder, DurationStore
+
+        def pytest_configure(config):
+            config.duration_store = DurationStore({str(db)!r})
+            config.duration_store.start_run({{"python": "3.11"}})
+            config.pluginmanager.register(DurationRecorder(config.duration_store))
+
+        def pytest_unconfigure(config):
+            config.duration_store.close()
+    """)
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.fixture
+        def broken():
+            raise RuntimeError("setup failure")
+
+        @pytest.fixture
+        def leaky():
+            yield
+            raise RuntimeError("teardown failure")
+
+        def test_passes():
+            pass
+
+        @pytest.mark.xfail(reason="BUG")
+        def test_xfails():
+            assert False
+
+        @pytest.mark.xfail(reason="BUG")
+        def test_xpasses():
+            pass
+
+        def test_setup_error(broken):
+            pass
+
+        def test_teardown_error(leaky):
+            pass
+    """)
+
+    pytester.runpytest_inprocess("-p", "no:cacheprovider")
+
+    store = DurationStore(str(db))
+    outcomes = dict(store.connection.execute(
+        "SELECT substr(nodeid, instr(nodeid, '::') + 2), outcome FROM test_durations"
+    ))
+    assert outcomes == {
+        "test_passes": "passed",
+        "test_xfails": "xfailed",
+        "test_xpasses": "xpassed",
+        "test_setup_error": "failed",
+        "test_teardown_error": "failed",
+    }
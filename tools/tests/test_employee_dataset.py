@@ -0,0 +1,78 @@
+import requests
+
+from tools.employee_dataset import feed, generate_employees, read_ndjson, write_ndjson
+
+
+class FakeResponse:
+    status_code = 200
+
+
+class FakeEmployeesAPI:
+    """
+    Minimal stand-in for EmployeesAPI that records created payloads.
+    """
+
+    def __init__(self, failures=()):
+        self.created = []
+        self.failures = list(failures)
+
+    def create_employee(self, payload):
+        self.created.append(payload)
+        if self.failures:
+            raise self.failures.pop(0)
+        return FakeResponse()
+
+
+def test_generator_is_deterministic():
+    """
+    Verify that the same seed always produces the same dataset.
+    """
+    assert list(generate_employees(100, seed=7)) == list(generate_employees(100, seed=7))
+    assert list(generate_employees(100, seed=7)) != list(generate_employees(100, seed=8))
+
+
+def test_generator_includes_edge_cases():
+    """
+    Verify that leading-zero and negative dependants are generated.
+    """
+    dependants = [e["dependants"] for e in generate_employees(5000, seed=1)]
+
+    assert any(isinstance(d, str) and d.startswith("0") for d in dependants)
+    assert any(isinstance(d, int) and d < 0 for d in dependants)
+
+
+def test_ndjson_round_trip(tmp_path):
+    """
+    Verify that a gzip NDJSON dataset reads back identically.
+    """
+    path = str(tmp_path / "employees.ndjson.gz")
+
+    written = write_ndjson(path, generate_employees(500, seed=3))
+
+    assert written == 500
+    assert list(read_ndjson(path)) == list(generate_employees(500, seed=3))
+
+
+def test_feed_respects_limit():
+    """
+    Verify that the feeder stops after the requested number of employees.
+    """
+    api = FakeEmployeesAPI()
+
+    summary = feed(api, generate_employees(100, seed=0), rate=1000, limit=10)
+
+    assert summary["sent"] == 10
+    assert summary["status_codes"] == {200: 10}
+    assert len(api.created) == 10
+
+
+def test_feed_counts_request_errors_and_continues():
+    """
+    Verify that timeouts and resets are counted instead of aborting the replay.
+    """
+    api = FakeEmployeesAPI([requests.Timeout(), requests.ConnectionError()])
+
+    summary = feed(api, generate_employees(5, seed=0))
+
+    assert summary["sent"] == 5
+    assert summary["status_codes"] == {"error": 2, 200: 3}
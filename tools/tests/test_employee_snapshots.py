@@ -0,0 +1,144 @@
+import pytest
+import requests
+
+from tools.employee_snapshots import Snapshot, SnapshotStore, capture, diff_snapshots, fingerprint, main
+
+
+def employee(employee_id, first_name="John", last_name="Doe", dependants=2):
+    """
+    Build a minimal employee record as returned by GET /Employees.
+    """
+    return {
+        "id": employee_id,
+        "firstName": first_name,
+        "lastName": last_name,
+        "dependants": dependants,
+    }
+
+
+def test_fingerprint_ignores_key_order():
+    """
+    Verify that the content hash is stable regardless of key order.
+    """
+    record = employee("1")
+
+    assert fingerprint(record) == fingerprint(dict(reversed(list(record.items()))))
+
+
+def test_diff_detects_added_removed_changed_and_duplicates():
+    """
+    Verify every category reported by the snapshot differ.
+    """
+    old = Snapshot.from_records([employee("1"), employee("2", "Jane"), employee("3", "Ann")])
+    new = Snapshot.from_records([
+        employee("1"),
+        employee("2", "Janet"),
+        employee("4", "Ann"),
+        employee("4", "Ann"),
+        employee("5", "Ann"),
+    ])
+
+    result = diff_snapshots(old, new)
+
+    assert result["added"] == {"4", "5"}
+    assert result["removed"] == {"3"}
+    assert result["changed"] == {"2"}
+    assert result["duplicate_ids"] == {"4"}
+    assert result["new_duplicates"] == [["4", "5"]]
+
+
+def test_store_keeps_unchanged_records_once(tmp_path):
+    """
+    Verify that unchanged records are not stored again by later snapshots.
+    """
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    records = [employee(str(i)) for i in range(10)]
+
+    first = store.save(records)
+    second = store.save(records[:9] + [employee("9", "Changed")])
+
+    stored = store.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+    assert stored == 11
+    assert diff_snapshots(store.load(first), store.load(second))["changed"] == {"9"}
+    assert store.record(fingerprint(records[0])) == records[0]
+
+
+def test_diff_reports_only_new_or_grown_duplicate_groups():
+    """
+    Verify that duplicates already present in `old` are not reported again,
+    and that records without an ID are counted instead of grouped.
+    """
+    old = Snapshot.from_records([
+        employee("1"), employee("2"),
+        employee("3", "Ann"), employee("4", "Ann"),
+    ])
+    new = Snapshot.from_records([
+        employee("1"), employee("2"),
+        employee("3", "Ann"), employee("4", "Ann"), employee("5", "Ann"),
+        employee("6", "Bob"), employee("7", "Bob"),
+        employee(None, "Ghost"), employee(None, "Ghost"),
+    ])
+
+    result = diff_snapshots(old, new)
+
+    assert result["new_duplicates"] == [["3", "4", "5"], ["6", "7"]]
+    assert result["missing_ids"] == 2
+    assert None not in result["added"]
+
+
+DEFAULT_BODY = b'[{"id": "1", "firstName": "John"}]'
+
+
+class FlakyEmployeesAPI:
+    """
+    Stand-in for EmployeesAPI whose GET /Employees fails in scripted ways.
+
+    Each outcome is an exception to raise, a status code, or a
+    (status code, body) tuple.
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+
+    def get_employees(self):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status_code, body = outcome if isinstance(outcome, tuple) else (outcome, DEFAULT_BODY)
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        return response
+
+
+def test_capture_skips_failed_requests(tmp_path):
+    """
+    Verify that a 5xx, a timeout or a body that is not a list of employees
+    skips one capture instead of stopping the loop.
+    """
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    api = FlakyEmployeesAPI([
+        200, 503, requests.Timeout("stalled"), (200, b'{"message": "Throttled"}'), (200, b'["1"]'), 200,
+    ])
+
+    snapshot_ids = capture(api, store, count=6, interval=0)
+
+    assert len(snapshot_ids) == 2
+    assert [size for _, _, size in store.snapshots()] == [1, 1]
+
+
+def test_diff_rejects_unknown_snapshot_ids(tmp_path, capsys):
+    """
+    Verify that diffing a snapshot ID that was never stored is an error,
+    not a diff against an empty snapshot.
+    """
+    db = str(tmp_path / "snapshots.db")
+    store = SnapshotStore(db)
+    store.save([employee("1")])
+    store.close()
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--db", db, "diff", "1", "7"])
+
+    assert exit_info.value.code == 2
+    assert "unknown snapshot ID(s): 7" in capsys.readouterr().err
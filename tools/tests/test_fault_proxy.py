@@ -0,0 +1,187 @@
+import http.client
+import socket
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tools.fault_proxy import PROFILES, FaultProfile, FaultProxy, main, run_resilience_benchmark
+
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    """
+    Local upstream answering every request with an empty employee list.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    do_HEAD = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def upstream():
+    """
+    Runs a local upstream server for the duration of a test.
+
+    Yields:
+        str: Origin of the upstream server.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UpstreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def get_status(proxy):
+    """
+    Send GET /Prod/api/Employees through the proxy.
+
+    Returns:
+        int | str: Status code, or the exception name if the connection failed.
+    """
+    connection = http.client.HTTPConnection(*proxy.server_address[:2], timeout=5)
+    try:
+        connection.request("GET", "/Prod/api/Employees")
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    except OSError as error:
+        return type(error).__name__
+    finally:
+        connection.close()
+
+
+def test_proxy_forwards_requests(upstream):
+    """
+    Verify that requests pass through untouched with no faults configured.
+    """
+    proxy = FaultProxy(FaultProfile("baseline"), upstream=upstream, port=0).start()
+    try:
+        assert [get_status(proxy) for _ in range(3)] == [200, 200, 200]
+    finally:
+        proxy.stop()
+
+
+def test_proxy_injects_5xx_bursts(upstream):
+    """
+    Verify that a triggered burst returns consecutive 5xx responses.
+    """
+    profile = FaultProfile("bursts", error_rate=1.0, burst_length=3, error_status=502)
+    proxy = FaultProxy(profile, upstream=upstream, port=0).start()
+    try:
+        assert [get_status(proxy) for _ in range(3)] == [502, 502, 502]
+    finally:
+        proxy.stop()
+
+
+def test_proxy_resets_connections(upstream):
+    """
+    Verify that the reset fault drops the connection without a response.
+    """
+    proxy = FaultProxy(FaultProfile("resets", reset_rate=1.0), upstream=upstream, port=0).start()
+    try:
+        assert get_status(proxy) in ("ConnectionResetError", "RemoteDisconnected")
+    finally:
+        proxy.stop()
+
+
+def test_proxy_ignores_client_disconnects(upstream, capfd):
+    """
+    Verify that a client leaving before the response is written does not
+    print a traceback.
+    """
+    profile = FaultProfile("slow", latency=("constant", 200))
+    proxy = FaultProxy(profile, upstream=upstream, port=0).start()
+    try:
+        client = socket.create_connection(proxy.server_address[:2])
+        client.sendall(b"GET /Prod/api/Employees HTTP/1.1\r\nHost: proxy\r\n\r\n")
+        client.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        client.close()
+        time.sleep(0.5)
+        assert get_status(proxy) == 200
+    finally:
+        proxy.stop()
+
+    assert "Traceback" not in capfd.readouterr().err
+
+
+def test_proxy_keeps_content_length_for_head(upstream):
+    """
+    Verify that HEAD responses report the upstream Content-Length.
+    """
+    proxy = FaultProxy(FaultProfile("baseline"), upstream=upstream, port=0).start()
+    try:
+        connection = http.client.HTTPConnection(*proxy.server_address[:2], timeout=5)
+        connection.request("HEAD", "/Prod/api/Employees")
+        response = connection.getresponse()
+        connection.close()
+    finally:
+        proxy.stop()
+
+    assert response.status == 200
+    assert response.getheader("Content-Length") == "2"
+
+
+def test_benchmark_retries_through_resets(upstream):
+    """
+    Verify that resets are retried and counted without timeouts.
+    """
+    result = run_resilience_benchmark(
+        PROFILES["resets"], requests_count=30, workers=1, max_retries=2, upstream=upstream
+    )
+
+    assert result["succeeded"] == 30
+    assert result["retries"] > 0
+    assert result["timeouts"] == 0
+
+
+def test_benchmark_reports_5xx_bursts_longer_than_retries(upstream):
+    """
+    Verify that bursts outlasting the retry budget surface as failed requests.
+    """
+    result = run_resilience_benchmark(
+        PROFILES["5xx-bursts"], requests_count=60, workers=1, max_retries=2, upstream=upstream
+    )
+
+    failed = result["requests"] - result["succeeded"]
+    assert 0 < failed < result["requests"]
+    assert result["retries"] >= failed * 2
+    assert result["timeouts"] == 0
+
+
+def test_benchmark_counts_timeouts(upstream):
+    """
+    Verify that every attempt against a stalled backend is counted as a timeout.
+    """
+    stalled = FaultProfile("stalled", latency=("constant", 500))
+
+    result = run_resilience_benchmark(
+        stalled, requests_count=3, workers=3, timeout=0.1, max_retries=1, upstream=upstream
+    )
+
+    assert result["succeeded"] == 0
+    assert result["timeouts"] == 6
+    assert result["retries"] == 3
+
+
+def test_benchmark_command_uses_upstream_option(upstream, capsys):
+    """
+    Verify that `benchmark --upstream` sends the requests to the given origin.
+    """
+    assert main(["benchmark", "--profiles", "baseline", "--requests", "3", "--upstream", upstream]) == 0
+
+    assert capsys.readouterr().out.splitlines()[-1].split()[:2] == ["baseline", "3/3"]